@@ -54,7 +54,13 @@ def extract_and_copy_files():
     shutil.copy('./THORIUM_SHELL.BAT', './temp/')
 
 def zip_files():
-    # Create zip archive
+    # Create zip archive, preferring 7-Zip's multithreaded deflate
+    if shutil.which('7z'):
+        # 7z a appends to an existing archive, so start from a fresh one
+        if os.path.exists('thorium_portable.zip'):
+            os.remove('thorium_portable.zip')
+        try_run('7z a -tzip -mmt=on thorium_portable.zip ./temp/*')
+        return
     with zipfile.ZipFile('thorium_portable.zip', 'w', zipfile.ZIP_DEFLATED) as zf:
         for root, _, files in os.walk('./temp'):
             for file in files:
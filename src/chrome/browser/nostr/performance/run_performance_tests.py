@@ -10,26 +10,34 @@ This script runs the performance test suite and generates reports for CI/CD inte
 """
 
 import argparse
+import concurrent.futures
+import hashlib
 import json
 import os
+import re
 import subprocess
 import sys
 import time
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
-# Performance test categories
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Performance test categories (test names are immutable tuples)
 PERFORMANCE_TEST_CATEGORIES = {
-    'startup': [
+    'startup': (
         'TungstenPerformanceTest.NostrServiceInitializationPerformance',
         'TungstenPerformanceTest.LocalRelayStartupPerformance',
-    ],
-    'memory': [
+    ),
+    'memory': (
         'TungstenPerformanceTest.BaseMemoryUsage',
         'TungstenPerformanceTest.NostrServiceMemoryUsage',
         'TungstenPerformanceTest.LocalRelayMemoryUsage',
         'TungstenPerformanceTest.MemoryUsageWithManyEvents',
-    ],
-    'nip07': [
+    ),
+    'nip07': (
         'NIP07PerformanceTest.GetPublicKeyPerformance',
         'NIP07PerformanceTest.SignEventPerformance',
         'NIP07PerformanceTest.EncryptionPerformance',
@@ -37,8 +45,8 @@ PERFORMANCE_TEST_CATEGORIES = {
         'NIP07PerformanceTest.GetRelaysPerformance',
         'NIP07PerformanceTest.ConcurrentOperationsPerformance',
         'NIP07PerformanceTest.LargeEventSigningPerformance',
-    ],
-    'relay': [
+    ),
+    'relay': (
         'LocalRelayPerformanceTest.EventInsertPerformance',
         'LocalRelayPerformanceTest.EventQueryPerformance',
         'LocalRelayPerformanceTest.SubscriptionPerformance',
@@ -47,8 +55,8 @@ PERFORMANCE_TEST_CATEGORIES = {
         'LocalRelayPerformanceTest.DatabaseSizePerformance',
         'LocalRelayPerformanceTest.ComplexQueryPerformance',
         'LocalRelayPerformanceTest.MemoryUsageWithManyEvents',
-    ],
-    'library': [
+    ),
+    'library': (
         'LibraryLoadingPerformanceTest.NDKLibraryLoadingPerformance',
         'LibraryLoadingPerformanceTest.NostrToolsLibraryLoadingPerformance',
         'LibraryLoadingPerformanceTest.Secp256k1LibraryLoadingPerformance',
@@ -58,7 +66,7 @@ PERFORMANCE_TEST_CATEGORIES = {
         'LibraryLoadingPerformanceTest.LibraryLoadingCacheEffectiveness',
         'LibraryLoadingPerformanceTest.LibraryBundleSizeImpact',
         'LibraryLoadingPerformanceTest.LibraryExecutionOverhead',
-    ],
+    ),
 }
 
 # Performance thresholds from CLAUDE.md
@@ -70,14 +78,193 @@ PERFORMANCE_THRESHOLDS = {
     'cpu_usage_percent': 0.1,
 }
 
+# Results cache for unchanged test binaries, stored in the output directory
+PERF_CACHE_FILENAME = '.perf_cache.json'
+
+# Characters of output kept for failing tests in the results file
+OUTPUT_TAIL_CHARS = 4096
+
+# Perf result format: [*]RESULT MetricName: value units, where perf_test
+# prefixes important metrics with '*'
+_RESULT_RE = re.compile(
+    r'^[ \t]*\*?RESULT[ \t]+([^\s:]+)[ \t]*:[ \t]*'
+    r'([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)',
+    re.MULTILINE)
+
+def _print_progress(line: str) -> None:
+    """Print a progress line immediately, even when stdout is a pipe."""
+    print(line, flush=True)
+
+def _run_category(test_binary: str, category: str, verbose: bool,
+                  keep_full_output: bool,
+                  log: Callable[[str], None] = _print_progress
+                  ) -> Tuple[List[Dict], str]:
+    """Run all tests of a category in one process.
+    
+    Returns the per-test results and the batch's stderr, which belongs to the
+    whole category rather than to any one test. Progress lines are passed to
+    |log| as they happen. Only the tail of failing output is kept unless
+    |keep_full_output| is set.
+    """
+    test_names = PERFORMANCE_TEST_CATEGORIES[category]
+    log(f"Running {category} performance tests...")
+    
+    # The test launcher only relays a child's gtest output for failing tests
+    # unless told otherwise; the per-test RUN/OK markers are needed here.
+    cmd = [
+        test_binary,
+        f'--gtest_filter={":".join(test_names)}',
+        '--test-launcher-print-test-stdio=always',
+        '--test-launcher-print-perf-results'
+    ]
+    
+    if verbose:
+        cmd.append('--v=1')
+    
+    timed_out = False
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, 
+                              timeout=300 * len(test_names))  # 5 minutes per test
+        stdout, stderr, returncode = result.stdout, result.stderr, result.returncode
+    except subprocess.TimeoutExpired as e:
+        # Keep the results of the tests that finished before the hang
+        log(f"  TIMEOUT: {category}")
+        timed_out = True
+        stdout, stderr, returncode = _decode(e.stdout), _decode(e.stderr), -1
+    
+    test_outputs = split_test_output(stdout)
+    category_results = []
+    any_failed = False
+    
+    # A non-zero exit after every test reported OK (e.g. a LeakSanitizer
+    # report or a crash in suite teardown) is not explained by any single
+    # test, so it fails them all.
+    batch_failed = returncode != 0 and all(
+        test_outputs.get(test_name, (None, ''))[0] for test_name in test_names)
+    
+    for test_name in test_names:
+        status, output = test_outputs.get(test_name, (None, ''))
+        error = None
+        if status is None:
+            if timed_out:
+                error = 'Test timeout'
+            elif test_name in test_outputs:
+                # Started but never finished: the test crashed
+                status = False
+            else:
+                # Without markers, a clean exit means the test passed
+                status = returncode == 0
+        elif status and batch_failed:
+            status = False
+            error = ('Test timeout after all tests reported OK' if timed_out else
+                     f'Test binary exited with code {returncode} after all tests reported OK')
+        passed = bool(status) and error is None
+        
+        test_result = {
+            'test_name': test_name,
+            'exit_code': 0 if passed else returncode,
+            'success': passed
+        }
+        if error:
+            test_result['error'] = error
+        if keep_full_output:
+            test_result['stdout'] = output
+        else:
+            test_result['stdout_tail'] = '' if passed else output[-OUTPUT_TAIL_CHARS:]
+        
+        # Parse performance metrics from this test's output
+        metrics = parse_performance_metrics(output)
+        test_result['metrics'] = metrics
+        
+        category_results.append(test_result)
+        
+        if error == 'Test timeout':
+            any_failed = True
+            log(f"  TIMEOUT: {test_name}")
+        elif not passed:
+            any_failed = True
+            log(f"  FAILED: {test_name}")
+        else:
+            log(f"  PASSED: {test_name}")
+            if metrics and verbose:
+                for metric, value in metrics.items():
+                    log(f"    {metric}: {value}")
+    
+    if any_failed and verbose and stderr:
+        log(f"  Error: {stderr}")
+    
+    if not keep_full_output:
+        stderr = stderr[-OUTPUT_TAIL_CHARS:] if any_failed else ''
+    return category_results, stderr
+
+def _decode(output) -> str:
+    """Decode output captured by a TimeoutExpired exception."""
+    if output is None:
+        return ''
+    if isinstance(output, bytes):
+        return output.decode(errors='replace')
+    return output
+
+def _file_sha256(file_path: str) -> str:
+    """Calculate SHA-256 hash of a file."""
+    with open(file_path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        sha256_hash = hashlib.sha256()
+        buf = memoryview(bytearray(1 << 20))
+        while n := f.readinto(buf):
+            sha256_hash.update(buf[:n])
+        return sha256_hash.hexdigest()
+
+def _load_perf_cache(cache_file: str, binary_hash: str,
+                     keep_full_output: bool) -> Dict[str, List[Dict]]:
+    """Load cached category results recorded for the given test binary hash."""
+    try:
+        with open(cache_file, 'r') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    
+    # Entries for any other binary, or recorded with a different amount of
+    # output, are stale
+    if (cache.get('binary_sha256') != binary_hash or
+            cache.get('keep_full_output', False) != keep_full_output):
+        return {}
+    return cache.get('categories', {})
+
+def _save_perf_cache(cache_file: str, binary_hash: str, keep_full_output: bool,
+                     categories: Dict[str, List[Dict]]) -> None:
+    """Save cached category results for the given test binary hash.
+    
+    The cache is replaced in one step so an interrupted run cannot leave a
+    truncated file behind.
+    """
+    tmp_file = cache_file + '.tmp'
+    with open(tmp_file, 'w') as f:
+        json.dump({'binary_sha256': binary_hash,
+                   'keep_full_output': keep_full_output,
+                   'categories': categories}, f)
+    os.replace(tmp_file, cache_file)
+
 def run_performance_tests(build_dir: str, test_categories: List[str], 
-                         output_dir: str, verbose: bool = False) -> Dict:
-    """Run performance tests and collect results."""
+                         output_dir: str, verbose: bool = False,
+                         jobs: int = 1, keep_full_output: bool = False,
+                         use_cache: bool = False) -> Dict:
+    """Run performance tests and collect results.
+    
+    Each category runs as a single test binary invocation, with up to |jobs|
+    categories in flight at once. The default of one keeps timing and memory
+    metrics free of cross-test interference.
+    
+    With |use_cache|, categories that fully passed on a byte-identical test
+    binary are taken from the cache in |output_dir| instead of being re-run.
+    """
     results = {
         'timestamp': time.time(),
         'build_dir': build_dir,
         'test_categories': test_categories,
         'results': {},
+        'category_stderr': {},
         'summary': {}
     }
     
@@ -86,99 +273,112 @@ def run_performance_tests(build_dir: str, test_categories: List[str],
     if not os.path.exists(test_binary):
         raise FileNotFoundError(f"Test binary not found: {test_binary}")
     
-    for category in test_categories:
+    # Validate once; a category requested twice is only run once
+    categories = []
+    for category in dict.fromkeys(test_categories):
         if category not in PERFORMANCE_TEST_CATEGORIES:
             print(f"Warning: Unknown test category '{category}'")
             continue
+        categories.append(category)
+    
+    cache_file = os.path.join(output_dir, PERF_CACHE_FILENAME)
+    cached = {}
+    if use_cache:
+        binary_hash = _file_sha256(test_binary)
+        cached = _load_perf_cache(cache_file, binary_hash, keep_full_output)
+    
+    category_results_map = {}
+    category_stderr_map = {}
+    to_run = []
+    for category in categories:
+        if category in cached:
+            print(f"Using cached {category} performance results (test binary unchanged)")
+            category_results_map[category] = cached[category]
+        else:
+            to_run.append(category)
+    
+    if jobs <= 1:
+        # Sequential runs print progress live
+        for category in to_run:
+            (category_results_map[category],
+             category_stderr_map[category]) = _run_category(
+                test_binary, category, verbose, keep_full_output)
+    else:
+        def run_buffered(category):
+            lines = []
+            return (*_run_category(test_binary, category, verbose,
+                                   keep_full_output, lines.append), lines)
         
-        print(f"Running {category} performance tests...")
-        category_results = []
-        
-        for test_name in PERFORMANCE_TEST_CATEGORIES[category]:
-            print(f"  Running {test_name}...")
-            
-            # Run individual test
-            cmd = [
-                test_binary,
-                f'--gtest_filter={test_name}',
-                '--test-launcher-print-perf-results'
-            ]
-            
-            if verbose:
-                cmd.append('--v=1')
-            
-            try:
-                result = subprocess.run(cmd, capture_output=True, text=True, 
-                                      timeout=300)  # 5 minute timeout
-                
-                test_result = {
-                    'test_name': test_name,
-                    'exit_code': result.returncode,
-                    'stdout': result.stdout,
-                    'stderr': result.stderr,
-                    'success': result.returncode == 0
-                }
-                
-                # Parse performance metrics from output
-                metrics = parse_performance_metrics(result.stdout)
-                test_result['metrics'] = metrics
-                
-                category_results.append(test_result)
-                
-                if result.returncode != 0:
-                    print(f"    FAILED: {test_name}")
-                    if verbose:
-                        print(f"    Error: {result.stderr}")
-                else:
-                    print(f"    PASSED: {test_name}")
-                    if metrics and verbose:
-                        for metric, value in metrics.items():
-                            print(f"      {metric}: {value}")
-                
-            except subprocess.TimeoutExpired:
-                print(f"    TIMEOUT: {test_name}")
-                category_results.append({
-                    'test_name': test_name,
-                    'exit_code': -1,
-                    'error': 'Test timeout',
-                    'success': False
-                })
-        
-        results['results'][category] = category_results
+        with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+            # map() preserves category order, so logs are printed deterministically
+            for category, (category_results, stderr, lines) in zip(
+                    to_run, executor.map(run_buffered, to_run)):
+                print("\n".join(lines))
+                category_results_map[category] = category_results
+                category_stderr_map[category] = stderr
+    
+    for category in categories:
+        results['results'][category] = category_results_map[category]
+        # Batch stderr is stored once per category, not copied into each test
+        if category_stderr_map.get(category):
+            results['category_stderr'][category] = category_stderr_map[category]
+    
+    if use_cache:
+        # Only fully passing categories are reused; failures always re-run
+        for category in to_run:
+            if all(r['success'] for r in category_results_map[category]):
+                cached[category] = category_results_map[category]
+        _save_perf_cache(cache_file, binary_hash, keep_full_output, cached)
     
     # Generate summary
     results['summary'] = generate_summary(results['results'])
     
     # Save results
     output_file = os.path.join(output_dir, 'performance_results.json')
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2)
+    if orjson is not None:
+        # orjson serializes large result sets several times faster
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w') as f:
+            json.dump(results, f, indent=2)
     
     print(f"Performance test results saved to: {output_file}")
     return results
 
-def parse_performance_metrics(output: str) -> Dict[str, float]:
-    """Parse performance metrics from test output."""
-    metrics = {}
+def split_test_output(output: str) -> Dict[str, Tuple[Optional[bool], str]]:
+    """Split gtest output into per-test (status, output) entries.
+    
+    Output for a test is everything between its "[ RUN      ]" line and the
+    matching "[       OK ]" or "[  FAILED  ]" line. Status is True for OK,
+    False for FAILED, and None for a test that started but never finished
+    (e.g. crashed or hung). Tests without a RUN marker are not included.
+    """
+    tests = {}
+    current = None
+    lines = []
     
-    # Look for perf result patterns
     for line in output.split('\n'):
-        if 'RESULT' in line:
-            # Parse perf result format: RESULT MetricName: value units
-            parts = line.split(':')
-            if len(parts) >= 2:
-                metric_part = parts[0].split()
-                if len(metric_part) >= 2:
-                    metric_name = metric_part[1]
-                    try:
-                        value_part = parts[1].strip().split()
-                        if value_part:
-                            value = float(value_part[0])
-                            metrics[metric_name] = value
-                    except (ValueError, IndexError):
-                        pass
-    
-    return metrics
+        if line.startswith('[ RUN      ] '):
+            current = line[13:].strip()
+            lines = []
+        elif current is not None and line.startswith(('[       OK ] ', '[  FAILED  ] ')):
+            if line[13:].split(' (')[0].strip() == current:
+                tests[current] = (line.startswith('[       OK ]'), '\n'.join(lines))
+                current = None
+        elif current is not None:
+            lines.append(line)
+    
+    # A test that never finished keeps its partial output
+    if current is not None:
+        tests[current] = (None, '\n'.join(lines))
+    
+    return tests
+
+def parse_performance_metrics(output: str) -> Dict[str, float]:
+    """Parse performance metrics from test output."""
+    return {match.group(1): float(match.group(2))
+            for match in _RESULT_RE.finditer(output)}
 
 def generate_summary(results: Dict) -> Dict:
     """Generate performance test summary."""
@@ -191,36 +391,36 @@ def generate_summary(results: Dict) -> Dict:
     }
     
     for category, category_results in results.items():
+        passed = sum(1 for test_result in category_results if test_result['success'])
         category_summary = {
             'total': len(category_results),
-            'passed': 0,
-            'failed': 0,
+            'passed': passed,
+            'failed': len(category_results) - passed,
             'metrics': {}
         }
         
         for test_result in category_results:
-            summary['total_tests'] += 1
-            category_summary['total'] += 1
-            
-            if test_result['success']:
-                summary['passed_tests'] += 1
-                category_summary['passed'] += 1
-            else:
-                summary['failed_tests'] += 1
-                category_summary['failed'] += 1
-            
-            # Collect metrics
+            # Accumulate metrics as running count/sum/min/max
             if 'metrics' in test_result:
                 for metric, value in test_result['metrics'].items():
-                    if metric not in category_summary['metrics']:
-                        category_summary['metrics'][metric] = []
-                    category_summary['metrics'][metric].append(value)
+                    stats = category_summary['metrics'].get(metric)
+                    if stats is None:
+                        category_summary['metrics'][metric] = {
+                            'count': 1, 'sum': value, 'min': value, 'max': value
+                        }
+                        continue
+                    stats['count'] += 1
+                    stats['sum'] += value
+                    if value < stats['min']:
+                        stats['min'] = value
+                    if value > stats['max']:
+                        stats['max'] = value
         
         # Check for performance issues
         if category == 'startup':
-            startup_times = category_summary['metrics'].get('NostrServiceInit', [])
-            if startup_times:
-                avg_startup = sum(startup_times) / len(startup_times)
+            startup_stats = category_summary['metrics'].get('NostrServiceInit')
+            if startup_stats:
+                avg_startup = startup_stats['sum'] / startup_stats['count']
                 if avg_startup > PERFORMANCE_THRESHOLDS['startup_overhead_ms']:
                     summary['performance_issues'].append({
                         'category': category,
@@ -231,78 +431,74 @@ def generate_summary(results: Dict) -> Dict:
         
         summary['categories'][category] = category_summary
     
+    categories = summary['categories'].values()
+    summary['total_tests'] = sum(c['total'] for c in categories)
+    summary['passed_tests'] = sum(c['passed'] for c in categories)
+    summary['failed_tests'] = sum(c['failed'] for c in categories)
+    
     return summary
 
 def generate_report(results: Dict, output_dir: str) -> str:
     """Generate human-readable performance report."""
-    report_lines = []
-    
-    # Header
-    report_lines.append("# dryft Performance Test Report")
-    report_lines.append("")
-    report_lines.append(f"**Test Date:** {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(results['timestamp']))}")
-    report_lines.append(f"**Build Directory:** {results['build_dir']}")
-    report_lines.append("")
-    
-    # Summary
-    summary = results['summary']
-    report_lines.append("## Summary")
-    report_lines.append("")
-    report_lines.append(f"- **Total Tests:** {summary['total_tests']}")
-    report_lines.append(f"- **Passed:** {summary['passed_tests']}")
-    report_lines.append(f"- **Failed:** {summary['failed_tests']}")
-    report_lines.append(f"- **Success Rate:** {(summary['passed_tests'] / summary['total_tests'] * 100):.1f}%")
-    report_lines.append("")
-    
-    # Performance Issues
-    if summary['performance_issues']:
-        report_lines.append("## Performance Issues")
-        report_lines.append("")
-        for issue in summary['performance_issues']:
-            report_lines.append(f"- **{issue['category']}:** {issue['issue']}")
-            report_lines.append(f"  - Actual: {issue['actual']:.2f}")
-            report_lines.append(f"  - Threshold: {issue['threshold']}")
-        report_lines.append("")
-    
-    # Category Results
-    report_lines.append("## Test Categories")
-    report_lines.append("")
-    
-    for category, category_summary in summary['categories'].items():
-        report_lines.append(f"### {category.title()} Tests")
-        report_lines.append("")
-        report_lines.append(f"- **Total:** {category_summary['total']}")
-        report_lines.append(f"- **Passed:** {category_summary['passed']}")
-        report_lines.append(f"- **Failed:** {category_summary['failed']}")
-        
-        if category_summary['metrics']:
-            report_lines.append("")
-            report_lines.append("**Performance Metrics:**")
-            for metric, values in category_summary['metrics'].items():
-                if values:
-                    avg_value = sum(values) / len(values)
-                    min_value = min(values)
-                    max_value = max(values)
-                    report_lines.append(f"- {metric}: {avg_value:.2f} avg ({min_value:.2f}-{max_value:.2f} range)")
-        
-        report_lines.append("")
-    
-    # Performance Targets
-    report_lines.append("## Performance Targets")
-    report_lines.append("")
-    report_lines.append("| Metric | Target | Status |")
-    report_lines.append("|--------|---------|---------|")
-    
-    for metric, threshold in PERFORMANCE_THRESHOLDS.items():
-        report_lines.append(f"| {metric} | {threshold} | ✓ |")
-    
-    report_lines.append("")
-    
-    # Write report
-    report_content = "\n".join(report_lines)
     report_file = os.path.join(output_dir, 'performance_report.md')
     with open(report_file, 'w') as f:
-        f.write(report_content)
+        write = f.write
+        
+        # Header
+        write("# dryft Performance Test Report\n")
+        write("\n")
+        write(f"**Test Date:** {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(results['timestamp']))}\n")
+        write(f"**Build Directory:** {results['build_dir']}\n")
+        write("\n")
+        
+        # Summary
+        summary = results['summary']
+        write("## Summary\n")
+        write("\n")
+        write(f"- **Total Tests:** {summary['total_tests']}\n")
+        write(f"- **Passed:** {summary['passed_tests']}\n")
+        write(f"- **Failed:** {summary['failed_tests']}\n")
+        write(f"- **Success Rate:** {(summary['passed_tests'] / summary['total_tests'] * 100):.1f}%\n")
+        write("\n")
+        
+        # Performance Issues
+        if summary['performance_issues']:
+            write("## Performance Issues\n")
+            write("\n")
+            for issue in summary['performance_issues']:
+                write(f"- **{issue['category']}:** {issue['issue']}\n")
+                write(f"  - Actual: {issue['actual']:.2f}\n")
+                write(f"  - Threshold: {issue['threshold']}\n")
+            write("\n")
+        
+        # Category Results
+        write("## Test Categories\n")
+        write("\n")
+        
+        for category, category_summary in summary['categories'].items():
+            write(f"### {category.title()} Tests\n")
+            write("\n")
+            write(f"- **Total:** {category_summary['total']}\n")
+            write(f"- **Passed:** {category_summary['passed']}\n")
+            write(f"- **Failed:** {category_summary['failed']}\n")
+            
+            if category_summary['metrics']:
+                write("\n")
+                write("**Performance Metrics:**\n")
+                for metric, stats in category_summary['metrics'].items():
+                    avg_value = stats['sum'] / stats['count']
+                    write(f"- {metric}: {avg_value:.2f} avg ({stats['min']:.2f}-{stats['max']:.2f} range)\n")
+            
+            write("\n")
+        
+        # Performance Targets
+        write("## Performance Targets\n")
+        write("\n")
+        write("| Metric | Target | Status |\n")
+        write("|--------|---------|---------|\n")
+        
+        for metric, threshold in PERFORMANCE_THRESHOLDS.items():
+            write(f"| {metric} | {threshold} | ✓ |\n")
     
     print(f"Performance report saved to: {report_file}")
     return report_file
@@ -314,7 +510,13 @@ def main():
     parser.add_argument('--categories', nargs='+', default=['startup', 'memory', 'nip07', 'relay', 'library'],
                        help='Test categories to run')
     parser.add_argument('--verbose', action='store_true', help='Verbose output')
+    parser.add_argument('--jobs', type=int, default=1,
+                       help='Number of test categories to run concurrently (default: 1)')
     parser.add_argument('--generate-report', action='store_true', help='Generate human-readable report')
+    parser.add_argument('--keep-full-output', action='store_true',
+                       help='Store complete test stdout and category stderr in the results file')
+    parser.add_argument('--use-cache', action='store_true',
+                       help='Reuse passing results when the test binary is unchanged')
     
     args = parser.parse_args()
     
@@ -329,7 +531,9 @@ def main():
     try:
         # Run performance tests
         results = run_performance_tests(args.build_dir, args.categories, 
-                                      args.output_dir, args.verbose)
+                                      args.output_dir, args.verbose,
+                                      args.jobs, args.keep_full_output,
+                                      args.use_cache)
         
         # Generate report if requested
         if args.generate_report:
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# Copyright 2024 The dryft Authors
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+"""Unit tests for run_performance_tests.py."""
+
+import subprocess
+import unittest
+from unittest import mock
+
+import run_performance_tests
+
+
+class SplitTestOutputTest(unittest.TestCase):
+    def test_passed_and_failed(self):
+        output = '\n'.join([
+            '[ RUN      ] Suite.A',
+            'RESULT A: 1.5 ms',
+            '[       OK ] Suite.A (3 ms)',
+            '[ RUN      ] Suite.B',
+            'RESULT B: 2 ms',
+            '[  FAILED  ] Suite.B (4 ms)',
+        ])
+        tests = run_performance_tests.split_test_output(output)
+        self.assertEqual(tests['Suite.A'], (True, 'RESULT A: 1.5 ms'))
+        self.assertEqual(tests['Suite.B'], (False, 'RESULT B: 2 ms'))
+
+    def test_crash_mid_test(self):
+        output = '\n'.join([
+            '[ RUN      ] Suite.A',
+            '[       OK ] Suite.A (3 ms)',
+            '[ RUN      ] Suite.B',
+            'RESULT B: 2 ms',
+        ])
+        tests = run_performance_tests.split_test_output(output)
+        self.assertEqual(tests['Suite.A'], (True, ''))
+        self.assertEqual(tests['Suite.B'], (None, 'RESULT B: 2 ms'))
+
+    def test_no_markers(self):
+        output = '\n'.join([
+            '[1/2] Suite.A (3 ms)',
+            '[2/2] Suite.B (4 ms)',
+            'SUCCESS: all tests passed.',
+        ])
+        self.assertEqual(run_performance_tests.split_test_output(output), {})
+
+
+class ParsePerformanceMetricsTest(unittest.TestCase):
+    def test_plain_result(self):
+        self.assertEqual(
+            run_performance_tests.parse_performance_metrics('RESULT Foo: 1.5 ms'),
+            {'Foo': 1.5})
+
+    def test_important_result(self):
+        self.assertEqual(
+            run_performance_tests.parse_performance_metrics('*RESULT Foo: 1.5 ms'),
+            {'Foo': 1.5})
+
+    def test_indented_result(self):
+        output = '\n'.join([
+            '  RESULT Foo: 1.5 ms',
+            '\t*RESULT Bar: -2e3 bytes',
+            'not a RESULT Baz: 3 ms',
+        ])
+        self.assertEqual(run_performance_tests.parse_performance_metrics(output),
+                         {'Foo': 1.5, 'Bar': -2000.0})
+
+
+class RunCategoryTest(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.dict(run_performance_tests.PERFORMANCE_TEST_CATEGORIES,
+                                  {'fake': ('Suite.A', 'Suite.B')})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def run_category(self, **run_kwargs):
+        with mock.patch('subprocess.run', **run_kwargs) as run:
+            results, self.stderr = run_performance_tests._run_category(
+                'unit_tests', 'fake', verbose=False, keep_full_output=False,
+                log=lambda line: None)
+        self.assertIn('--test-launcher-print-test-stdio=always', run.call_args[0][0])
+        return {r['test_name']: r for r in results}
+
+    def test_launcher_output_without_markers_passes(self):
+        completed = subprocess.CompletedProcess(
+            [], 0, stdout='[1/2] Suite.A (3 ms)\n[2/2] Suite.B (4 ms)\n', stderr='')
+        results = self.run_category(return_value=completed)
+        self.assertTrue(results['Suite.A']['success'])
+        self.assertTrue(results['Suite.B']['success'])
+
+    def test_exit_code_per_test(self):
+        completed = subprocess.CompletedProcess([], 1, stdout='\n'.join([
+            '[ RUN      ] Suite.A',
+            '[       OK ] Suite.A (3 ms)',
+            '[ RUN      ] Suite.B',
+            '[  FAILED  ] Suite.B (4 ms)',
+        ]), stderr='')
+        results = self.run_category(return_value=completed)
+        self.assertEqual(results['Suite.A']['exit_code'], 0)
+        self.assertEqual(results['Suite.B']['exit_code'], 1)
+        self.assertFalse(results['Suite.B']['success'])
+
+    def test_stderr_kept_once_per_category(self):
+        completed = subprocess.CompletedProcess([], 1, stdout='\n'.join([
+            '[ RUN      ] Suite.A',
+            'A output',
+            '[  FAILED  ] Suite.A (3 ms)',
+            '[ RUN      ] Suite.B',
+            'B output',
+            '[  FAILED  ] Suite.B (4 ms)',
+        ]), stderr='batch stderr')
+        results = self.run_category(return_value=completed)
+        self.assertEqual(self.stderr, 'batch stderr')
+        self.assertEqual(results['Suite.A']['stdout_tail'], 'A output')
+        self.assertEqual(results['Suite.B']['stdout_tail'], 'B output')
+        for result in results.values():
+            self.assertNotIn('stderr_tail', result)
+
+    def test_nonzero_exit_after_all_ok_fails(self):
+        completed = subprocess.CompletedProcess([], 1, stdout='\n'.join([
+            '[ RUN      ] Suite.A',
+            '[       OK ] Suite.A (3 ms)',
+            '[ RUN      ] Suite.B',
+            '[       OK ] Suite.B (4 ms)',
+        ]), stderr='==1==ERROR: LeakSanitizer: detected memory leaks')
+        results = self.run_category(return_value=completed)
+        for result in results.values():
+            self.assertFalse(result['success'])
+            self.assertEqual(result['exit_code'], 1)
+        summary = run_performance_tests.generate_summary({'fake': list(results.values())})
+        self.assertEqual(summary['failed_tests'], 2)
+
+    def test_timeout_keeps_finished_tests(self):
+        timeout = subprocess.TimeoutExpired([], 600, output='\n'.join([
+            '[ RUN      ] Suite.A',
+            'RESULT A: 1.5 ms',
+            '[       OK ] Suite.A (3 ms)',
+            '[ RUN      ] Suite.B',
+        ]).encode(), stderr=b'')
+        results = self.run_category(side_effect=timeout)
+        self.assertTrue(results['Suite.A']['success'])
+        self.assertEqual(results['Suite.A']['metrics'], {'A': 1.5})
+        self.assertFalse(results['Suite.B']['success'])
+        self.assertEqual(results['Suite.B']['error'], 'Test timeout')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,6 +6,8 @@
 """Bundle Nostr JavaScript libraries for inclusion in dryft."""
 
 import argparse
+import concurrent.futures
+import errno
 import os
 import shutil
 import sys
@@ -14,6 +16,65 @@ import sys
 from library_config import get_input_to_output_mapping
 
 
+def fast_copy(src, dst):
+    """Copy a file and its metadata, letting the kernel move the data.
+
+    os.copy_file_range avoids copying through userspace buffers and can
+    reflink on filesystems that support it. Falls back to shutil.copyfile
+    where the syscall is unavailable or unsupported for these files.
+    """
+    copied_all = False
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(),
+                                                remaining)
+                    if copied == 0:
+                        # Some filesystems report no progress instead of an
+                        # errno; the copy is incomplete
+                        break
+                    remaining -= copied
+                copied_all = remaining <= 0
+        except OSError as e:
+            if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL,
+                               errno.EOPNOTSUPP):
+                raise
+    if not copied_all:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+def bundle_library(input_path, output_path):
+    """Bundle a single library file.
+
+    Returns an error message on failure, or None on success.
+    """
+    # fast_copy preserves mtime, so an output matching the input's size and
+    # mtime is already up to date and does not need to be rewritten
+    try:
+        src_st = os.stat(input_path)
+        dst_st = os.stat(output_path)
+        if (dst_st.st_size == src_st.st_size and
+                dst_st.st_mtime_ns == src_st.st_mtime_ns):
+            return None
+    except FileNotFoundError:
+        pass
+    
+    # For now, just copy the files
+    # In a real implementation, we would:
+    # 1. Minify if --optimize is set
+    # 2. Generate source maps if --source-map is set
+    # 3. Add any necessary wrappers or modifications
+    
+    try:
+        fast_copy(input_path, output_path)
+    except Exception as e:
+        return f"Error bundling {os.path.basename(input_path)}: {e}"
+    return None
+
+
 def main():
     parser = argparse.ArgumentParser(description='Bundle Nostr libraries')
     parser.add_argument('--optimize', action='store_true',
@@ -33,27 +94,35 @@ def main():
     # Get library mappings from shared configuration
     library_map = get_input_to_output_mapping()
     
-    # Process each library
-    for input_name, output_name in library_map.items():
-        input_path = os.path.join(args.input_dir, input_name)
-        output_path = os.path.join(args.output_dir, output_name)
-        
-        if not os.path.exists(input_path):
+    # List the input directory once instead of stat'ing each library
+    try:
+        with os.scandir(args.input_dir) as entries:
+            present = {entry.name for entry in entries if entry.is_file()}
+    except OSError as e:
+        print(f"Error: Cannot read input directory {args.input_dir}: {e}",
+              file=sys.stderr)
+        return 1
+    
+    for input_name in library_map:
+        if input_name not in present:
+            input_path = os.path.join(args.input_dir, input_name)
             print(f"Error: Input file {input_path} not found", file=sys.stderr)
             return 1
+    
+    # Process the libraries concurrently; results come back in map order
+    max_workers = min(len(library_map), (os.cpu_count() or 1) * 2) or 1
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        errors = executor.map(
+            lambda names: bundle_library(
+                os.path.join(args.input_dir, names[0]),
+                os.path.join(args.output_dir, names[1])),
+            library_map.items())
         
-        # For now, just copy the files
-        # In a real implementation, we would:
-        # 1. Minify if --optimize is set
-        # 2. Generate source maps if --source-map is set
-        # 3. Add any necessary wrappers or modifications
-        
-        try:
-            shutil.copy2(input_path, output_path)
+        for (input_name, output_name), error in zip(library_map.items(), errors):
+            if error:
+                print(error, file=sys.stderr)
+                return 1
             print(f"Bundled {input_name} -> {output_name}")
-        except Exception as e:
-            print(f"Error bundling {input_name}: {e}", file=sys.stderr)
-            return 1
     
     return 0
 
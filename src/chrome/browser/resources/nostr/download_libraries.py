@@ -5,38 +5,135 @@
 
 """Download actual Nostr JavaScript libraries for dryft."""
 
+import concurrent.futures
 import hashlib
+import http.client
 import json
 import os
+import ssl
 import sys
+import threading
+import time
+import urllib.error
 import urllib.request
 
 # Import shared library configuration
 from library_config import get_download_urls
 
+# Maximum number of libraries fetched in parallel
+MAX_DOWNLOAD_WORKERS = 8
+
+# Size of the buffer each download is streamed through
+DOWNLOAD_BUFFER_SIZE = 256 * 1024
+
+# Seconds a connection may stall (connect or per read) before it is retried
+DOWNLOAD_TIMEOUT_SECONDS = 30
+
+# Retry policy for transient download failures
+DOWNLOAD_ATTEMPTS = 3
+RETRY_BACKOFF_SECONDS = 0.3
+RETRY_HTTP_STATUSES = (429, 500, 502, 503, 504)
+
+# Serializes output from worker threads so lines do not interleave
+_print_lock = threading.Lock()
+
+
+def log(message):
+    """Print a message from any thread."""
+    with _print_lock:
+        print(message)
+
 
 def calculate_sha256(file_path):
     """Calculate SHA-256 hash of a file."""
-    sha256_hash = hashlib.sha256()
     with open(file_path, "rb") as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(byte_block)
-    return sha256_hash.hexdigest()
+        # hashlib.file_digest (Python 3.11+) runs the read loop in C
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        sha256_hash = hashlib.sha256()
+        buf = memoryview(bytearray(1 << 20))
+        while n := f.readinto(buf):
+            sha256_hash.update(buf[:n])
+        return sha256_hash.hexdigest()
 
 
 def download_file(url, output_path):
-    """Download a file from URL to output path."""
-    try:
-        print(f"Downloading {url}...")
-        with urllib.request.urlopen(url) as response:
-            data = response.read()
-            with open(output_path, 'wb') as f:
-                f.write(data)
-        print(f"Downloaded to {output_path}")
-        return True
-    except Exception as e:
-        print(f"Error downloading {url}: {e}")
-        return False
+    """Download a file from URL to output path.
+
+    The SHA-256 of the content is computed while it is written, so the file
+    does not have to be read back. Network errors and transient HTTP statuses
+    are retried with exponential backoff. Returns the hex digest, or None on
+    error.
+    """
+    for attempt in range(1, DOWNLOAD_ATTEMPTS + 1):
+        try:
+            log(f"Downloading {url}...")
+            sha256_hash = hashlib.sha256()
+            buf = memoryview(bytearray(DOWNLOAD_BUFFER_SIZE))
+            with urllib.request.urlopen(
+                    url, timeout=DOWNLOAD_TIMEOUT_SECONDS) as response, \
+                    open(output_path, 'wb') as f:
+                # readinto() reuses one buffer instead of allocating per chunk
+                while n := response.readinto(buf):
+                    f.write(buf[:n])
+                    sha256_hash.update(buf[:n])
+            log(f"Downloaded to {output_path}")
+            return sha256_hash.hexdigest()
+        except urllib.error.HTTPError as e:
+            if e.code not in RETRY_HTTP_STATUSES:
+                log(f"Error downloading {url}: {e}")
+                return None
+            error = e
+        except (urllib.error.URLError, http.client.HTTPException,
+                ConnectionError, TimeoutError, ssl.SSLError) as e:
+            error = e
+        
+        if attempt == DOWNLOAD_ATTEMPTS:
+            log(f"Error downloading {url}: {error}")
+            return None
+        log(f"Error downloading {url}: {error}, retrying...")
+        time.sleep(RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1))
+
+
+def save_hashes(hash_file, hashes):
+    """Write the hash file atomically.
+
+    The file is machine-maintained, so it is written compactly. Replacing it
+    in one step means an interrupted run cannot leave a truncated file that
+    would force every library to be downloaded again.
+    """
+    tmp_file = hash_file + '.tmp'
+    with open(tmp_file, 'w') as f:
+        json.dump(hashes, f, separators=(',', ':'))
+    os.replace(tmp_file, hash_file)
+
+
+def check_library(filename, saved, entry):
+    """Check whether a local library file matches its saved hash entry.
+
+    |entry| is the file's os.DirEntry, or None if it does not exist. Returns
+    the refreshed hash entry if the file is up to date, otherwise None.
+    """
+    if saved is None or entry is None:
+        return None
+    if isinstance(saved, str):
+        # Older hash files recorded only the digest
+        saved = {'sha256': saved}
+    
+    # Compare sizes first so a changed file is not hashed at all
+    st = entry.stat()
+    if saved.get('size', st.st_size) != st.st_size:
+        return None
+    
+    # Untouched since it was last verified; the saved hash still holds
+    if saved.get('mtime_ns') == st.st_mtime_ns:
+        return saved
+    
+    current_hash = calculate_sha256(filename)
+    if current_hash != saved['sha256']:
+        return None
+    return {'sha256': current_hash, 'size': st.st_size,
+            'mtime_ns': st.st_mtime_ns}
 
 
 def main():
@@ -44,14 +141,16 @@ def main():
     script_dir = os.path.dirname(os.path.abspath(__file__))
     third_party_dir = os.path.join(script_dir, 'third_party')
     
-    if not os.path.exists(third_party_dir):
-        os.makedirs(third_party_dir)
-    
+    os.makedirs(third_party_dir, exist_ok=True)
     os.chdir(third_party_dir)
     
+    # List the directory once instead of stat'ing each library
+    with os.scandir('.') as entries:
+        present = {entry.name: entry for entry in entries if entry.is_file()}
+    
     # Load existing hashes if available
     hash_file = 'library_hashes.json'
-    if os.path.exists(hash_file):
+    if hash_file in present:
         with open(hash_file, 'r') as f:
             saved_hashes = json.load(f)
     else:
@@ -60,32 +159,50 @@ def main():
     # Get library download URLs from shared configuration
     libraries = get_download_urls()
     
-    # Download and verify each library
+    # Verify existing files and download missing or stale ones concurrently;
+    # each download starts as soon as its library's check has finished
     updated_hashes = {}
-    for filename, info in libraries.items():
-        output_path = filename
+    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+        checks = {executor.submit(check_library, filename,
+                                  saved_hashes.get(filename),
+                                  present.get(filename)): filename
+                  for filename in libraries}
         
-        # Check if file exists and matches hash
-        if os.path.exists(output_path) and filename in saved_hashes:
-            current_hash = calculate_sha256(output_path)
-            if current_hash == saved_hashes[filename]:
-                print(f"{filename} already exists and hash matches, skipping...")
-                updated_hashes[filename] = current_hash
+        downloads = {}
+        for future in concurrent.futures.as_completed(checks):
+            filename = checks[future]
+            entry = future.result()
+            if entry is not None:
+                log(f"{filename} already exists and hash matches, skipping...")
+                updated_hashes[filename] = entry
                 continue
-        
-        # Download the file
-        if not download_file(info['url'], output_path):
+            downloads[filename] = executor.submit(
+                download_file, libraries[filename]['url'], filename)
+    
+    # Report in library order regardless of completion order
+    downloads = {filename: downloads[filename]
+                 for filename in libraries if filename in downloads}
+    
+    failed = False
+    for filename, future in downloads.items():
+        file_hash = future.result()
+        if file_hash is None:
             print(f"Failed to download {filename}")
-            return 1
-        
-        # Calculate and save hash
-        file_hash = calculate_sha256(output_path)
-        updated_hashes[filename] = file_hash
-        print(f"SHA-256: {file_hash}")
+            failed = True
+            continue
+        st = os.stat(filename)
+        updated_hashes[filename] = {
+            'sha256': file_hash,
+            'size': st.st_size,
+            'mtime_ns': st.st_mtime_ns
+        }
+        print(f"{filename} SHA-256: {file_hash}")
+    
+    if failed:
+        return 1
     
     # Save updated hashes
-    with open(hash_file, 'w') as f:
-        json.dump(updated_hashes, f, indent=2)
+    save_hashes(hash_file, updated_hashes)
     
     print("\nAll libraries downloaded successfully!")
     return 0
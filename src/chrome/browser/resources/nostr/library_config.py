@@ -5,6 +5,8 @@
 
 """Shared configuration for Nostr JavaScript libraries."""
 
+import types
+
 # Library definitions with versions and CDN URLs
 LIBRARY_CONFIG = {
     'ndk': {
@@ -51,14 +53,23 @@ LIBRARY_CONFIG = {
     }
 }
 
-def get_input_to_output_mapping():
-    """Get a dictionary mapping input filenames to output filenames."""
-    return {config['input_file']: config['output_file'] 
-            for config in LIBRARY_CONFIG.values()}
+# Derived lookups, built once at import and shared read-only
+_INPUT_TO_OUTPUT = types.MappingProxyType({
+    config['input_file']: config['output_file']
+    for config in LIBRARY_CONFIG.values()
+})
 
-def get_download_urls():
-    """Get a dictionary mapping filenames to their CDN URLs."""
-    return {config['input_file']: {
+_DOWNLOAD_URLS = types.MappingProxyType({
+    config['input_file']: types.MappingProxyType({
         'url': config['cdn_url'],
         'sha256': config['sha256']
-    } for config in LIBRARY_CONFIG.values()}
\ No newline at end of file
+    }) for config in LIBRARY_CONFIG.values()
+})
+
+def get_input_to_output_mapping():
+    """Get a read-only mapping of input filenames to output filenames."""
+    return _INPUT_TO_OUTPUT
+
+def get_download_urls():
+    """Get a read-only mapping of filenames to their CDN URLs."""
+    return _DOWNLOAD_URLS